@@ -0,0 +1,164 @@
+import math
+import random
+import re
+import subprocess
+import sys
+
+import pytest
+
+from unicodeplots import Lineplot
+from unicodeplots.canvas import _bresenham, braile
+from unicodeplots.utils import NUMPY_AVAILABLE, Color
+from unicodeplots.utils.backend import NUMBA_AVAILABLE
+
+
+def _render_sin(**kwargs) -> str:
+    x_vals = [x / 10 for x in range(-31, 62)]
+    return Lineplot(x_vals, math.sin, x_vals, math.cos, width=80, height=60, show_axes=True, **kwargs).render()
+
+
+def test_cell_buffers_are_flat():
+    canvas = braile.BrailleCanvas(width=20, height=16)
+    assert len(canvas._cells) == canvas.grid_rows * canvas.grid_cols
+    assert len(canvas._colors) == canvas.grid_rows * canvas.grid_cols
+    # Direct writes would bypass the render cache, so the buffers are not public
+    assert not hasattr(canvas, "active_cells") and not hasattr(canvas, "active_colors")
+
+
+def test_set_pixel_flat_index():
+    canvas = braile.BrailleCanvas(width=20, height=16)
+    canvas._set_pixel(3, 5, Color.RED)  # cell (1, 1), x_in=1, y_in=1
+    idx = 1 * canvas.grid_cols + 1
+    assert canvas._cells[idx] == 0x2800 | 0x10
+    assert canvas._colors[idx] == Color.RED
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+def test_python_fallback_matches_numpy(monkeypatch):
+    expected = _render_sin()
+    monkeypatch.setattr(braile, "NUMPY_AVAILABLE", False)
+    assert isinstance(braile.BrailleCanvas()._cells, list)
+    assert _render_sin() == expected
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+def test_vec_line_matches_scalar_line():
+    rng = random.Random(0)
+    # Includes zero-length and out-of-canvas segments
+    segments = [(1.0, 1.0, 1.0, 1.0), (-3.0, 2.0, 25.0, 9.0)] + [tuple(rng.uniform(-2, 22) for _ in range(4)) for _ in range(200)]
+    x1, y1, x2, y2 = (list(c) for c in zip(*segments))
+
+    expected = braile.BrailleCanvas(width=20, height=16)
+    for segment in segments:
+        expected.line(*segment, color=Color.RED)
+
+    actual = braile.BrailleCanvas(width=20, height=16)
+    actual.vec_line(x1, y1, x2, y2, color=Color.RED)
+    assert actual.render() == expected.render()
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+def test_vec_line_clips_long_segments():
+    rng = random.Random(1)
+    # Segments reaching far past the canvas are only expanded where they can be visible
+    segments = [tuple(rng.uniform(-500, 500) for _ in range(4)) for _ in range(100)]
+    x1, y1, x2, y2 = (list(c) for c in zip(*segments))
+
+    expected = braile.BrailleCanvas(width=20, height=16)
+    for segment in segments:
+        expected.line(*segment, color=Color.RED)
+
+    actual = braile.BrailleCanvas(width=20, height=16)
+    actual.vec_line(x1, y1, x2, y2, color=Color.RED)
+    assert actual.render() == expected.render()
+
+    # Would need gigabytes of step indices without clipping
+    plot = Lineplot(list(range(40)), [0.0] * 39 + [1e8], auto_scale=False)
+    assert plot.render()
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE or (_bresenham.compiled_scatter is None and not NUMBA_AVAILABLE), reason="no compiled kernel available")
+def test_compiled_segment_matches_python(monkeypatch):
+    rng = random.Random(2)
+    segments = [tuple(rng.uniform(-2, 22) for _ in range(4)) for _ in range(50)]
+
+    def render(canvas):
+        for segment in segments:
+            canvas.line(*segment, color=Color.RED)
+        return canvas.render()
+
+    monkeypatch.setattr(_bresenham, "_JIT_BUDGET", 0)
+    expected = render(braile.BrailleCanvas(width=20, height=16))
+    monkeypatch.setattr(braile, "scatter_kernel", lambda steps: None)
+    assert render(braile.BrailleCanvas(width=20, height=16)) == expected
+
+
+def test_numba_is_not_imported_for_short_segments():
+    # Importing numba costs a few hundred ms, a small plot must not pay for it
+    code = "import sys; from unicodeplots import Lineplot; Lineplot([1, 2, 3], [3, 1, 2]).render(); print(sys.modules.get('numba') is not None)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "False"
+
+
+def test_render_emits_one_escape_per_color_run():
+    canvas = braile.BrailleCanvas(width=20, height=16)
+    canvas.line(0, 8, 20, 8, color=Color.RED)
+    lines = canvas.render().split("\n")
+    assert len(lines) == canvas.grid_rows
+    assert all(line.count("\033[0m") == 1 for line in lines if "\033[38;5;196m" not in line)
+    assert sum(line.count("\033[38;5;196m") for line in lines) == 1
+
+
+@pytest.mark.parametrize("vectorize", [False, pytest.param(True, marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed"))])
+def test_half_pixel_ties_round_like_baseline(monkeypatch, vectorize):
+    if vectorize:
+        monkeypatch.setattr(braile.BrailleCanvas, "_VECTORIZE_THRESHOLD", 0)
+    # As a * y + b, y = 0 and y = 20 map to exact .5 ties (37.5, 7.5) instead of x_to_pixel's 37.4999..., 7.4999...
+    plot = Lineplot([25, 20, 27, 0, -2, -6, -23, -16, -19, 21], [21, 25, 20, 24, -7, -23, -8, 7, 22, 15], width=40, height=9, show_axes=True)
+    rendered = re.sub(r"\x1b\[[0-9;]*m", "", plot.render())
+    assert rendered == "⠀⠘⣯⠉⠉⠉⠙⠒⢲⡟⠛⠛⠛⠛⠛⠛⠛⠛⠉⠉\n⠿⢯⣉⣉⡉⠉⠉⣩⠟⡏⠉⠉⠉⠉⠉⠉⠉⠉⠉⠉"
+
+
+@pytest.mark.parametrize("numpy_available", [True, False], ids=["numpy", "python"])
+def test_incremental_render_matches_fresh_canvas(monkeypatch, numpy_available):
+    if numpy_available and not NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(braile, "NUMPY_AVAILABLE", numpy_available)
+    monkeypatch.setattr(braile.BrailleCanvas, "_VECTORIZE_THRESHOLD", 0)
+    # Each batch touches different rows, so a missed dirty flag shows up as a stale row
+    top = (0.0, 14.0, 20.0, 15.0)
+    bottom = (0.0, 1.0, 20.0, 2.0)
+    middle = [(0.0, 8.0, 20.0, 9.0), (4.0, 7.0, 16.0, 7.0)]
+
+    def draw_rest(canvas):
+        canvas.line(*bottom, color=Color.BLUE)
+        canvas.lines(*zip(*middle), color=Color.GREEN)
+
+    incremental = braile.BrailleCanvas(width=20, height=16)
+    incremental.line(*top, color=Color.RED)
+    incremental.render()
+    draw_rest(incremental)
+
+    fresh = braile.BrailleCanvas(width=20, height=16)
+    fresh.line(*top, color=Color.RED)
+    draw_rest(fresh)
+    assert incremental.render() == fresh.render()
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+@pytest.mark.parametrize("bad", [float("nan"), float("inf"), -float("inf"), 1e300])
+def test_vec_line_rejects_non_finite_coordinates(bad):
+    canvas = braile.BrailleCanvas(width=20, height=16)
+    with pytest.raises(ValueError, match="finite"):
+        canvas.vec_line([0.0, 1.0], [0.0, bad], [1.0, 2.0], [bad, 3.0], color=Color.RED)
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+def test_vec_line_spans_canvas_near_coordinate_bound():
+    canvas = braile.BrailleCanvas(width=20, height=16)
+    # Endpoints on opposite sides whose supersampled distance exceeds the int32 range
+    x = (2**30 - 64) / braile.BrailleCanvas._SUPERSAMPLE
+    canvas.vec_line([-x], [8.0], [x], [8.0], color=Color.RED)
+    assert canvas._cells.tolist().count(0x2809) == canvas.grid_cols
+
+    with pytest.raises(ValueError, match="finite"):
+        canvas.vec_line([-2147483000 / 8], [8.0], [2147483000 / 8], [8.0], color=Color.RED)
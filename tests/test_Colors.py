@@ -0,0 +1,8 @@
+import pytest
+
+from unicodeplots.utils import ColorType
+
+
+@pytest.mark.parametrize("value", [*ColorType, 39, 15, -1, 300, "WHITE", [1]], ids=repr)
+def test_from_value_matches_constructor(value):
+    assert ColorType.from_value(value) is ColorType(value)
@@ -101,3 +101,24 @@ def test_lineplot_data_and_scale(description, x_range_params, y_generator_func,
     # Use pytest.approx for float comparisons that might arise from scaling functions
     assert plot.min_y == pytest.approx(expected_scaled_min_y), f"Failed min_y (scaled) check for {description}"
     assert plot.max_y == pytest.approx(expected_scaled_max_y), f"Failed max_y (scaled) check for {description}"
+
+
+def test_numpy_array_input():
+    """
+    Tests that 1-D numeric numpy arrays are accepted, including integer dtypes.
+    """
+    np = pytest.importorskip("numpy")
+    plot = Lineplot(np.arange(5), np.arange(5) ** 2)
+    assert plot.datasets == [([0, 1, 2, 3, 4], [0, 1, 4, 9, 16])]
+    assert plot.render() == Lineplot([0, 1, 2, 3, 4], [0, 1, 4, 9, 16]).render()
+
+
+def test_numpy_ufunc_callable():
+    """
+    Tests that numpy ufuncs are applied to the whole x range and match the per-element result.
+    """
+    np = pytest.importorskip("numpy")
+    x_vals = [x / 10 for x in range(-31, 62)]
+    ((_, y_ufunc),) = Lineplot(x_vals, np.sin).datasets
+    ((_, y_math),) = Lineplot(x_vals, math.sin).datasets
+    assert y_ufunc == pytest.approx(y_math)
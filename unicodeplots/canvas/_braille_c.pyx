@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled counterpart of unicodeplots.canvas._bresenham._bresenham_scatter.
+
+Optional developer build, not part of ``pip install``. Build in place with
+``cythonize -i unicodeplots/canvas/_braille_c.pyx``.
+"""
+
+from libc.stdint cimport uint32_t
+
+
+cpdef void bresenham_scatter(
+    long px1,
+    long py1,
+    long px2,
+    long py2,
+    uint32_t[::1] grid,
+    long cols,
+    long rows,
+    uint32_t color_bits,
+    const uint32_t[::1] bit_lut,
+    int ss_shift,
+    int x_shift,
+    int y_shift,
+    long x_mask,
+    long y_mask,
+) noexcept nogil:
+    """Walk a supersampled Bresenham segment and store its pixels straight into the packed cell grid."""
+    cdef long dx = px2 - px1 if px2 > px1 else px1 - px2
+    cdef long dy = py2 - py1 if py2 > py1 else py1 - py2
+    cdef long sx = 1 if px1 < px2 else -1
+    cdef long sy = 1 if py1 < py2 else -1
+    cdef long err = dx - dy
+    cdef long e2, p_x, p_y, cx, cy, idx
+    cdef long last_x = 0, last_y = 0
+    cdef bint first = True
+    cdef long px_curr = px1, py_curr = py1
+
+    while True:
+        # >> on signed values is an arithmetic shift, matching Python's floor semantics
+        p_x = px_curr >> ss_shift
+        p_y = py_curr >> ss_shift
+        # Supersampled steps collapse onto the same pixel in runs, only emit on change
+        if first or p_x != last_x or p_y != last_y:
+            first = False
+            last_x = p_x
+            last_y = p_y
+            cx = p_x >> x_shift
+            cy = p_y >> y_shift
+            if 0 <= cx < cols and 0 <= cy < rows:
+                idx = cy * cols + cx
+                # Keep the codepoint half, OR in the dot and replace the color half in a single store
+                grid[idx] = (grid[idx] & 0xFFFF) | bit_lut[((p_x & x_mask) << 2) | (p_y & y_mask)] | color_bits
+
+        if px_curr == px2 and py_curr == py2:
+            break
+
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            px_curr += sx
+        if e2 < dx:
+            err += dx
+            py_curr += sy
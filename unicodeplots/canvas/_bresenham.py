@@ -0,0 +1,77 @@
+from typing import Any, Callable, Optional
+
+from unicodeplots.utils.backend import NUMBA_AVAILABLE
+
+# Supersampled steps walked in Python before loading numba pays off, roughly what its import and cache load cost
+_JIT_BUDGET = 2**20
+
+
+def _bresenham_scatter(px1, py1, px2, py2, grid, cols, rows, color_bits, bit_lut, ss_shift, x_shift, y_shift, x_mask, y_mask):
+    """Walk a supersampled Bresenham segment and store its pixels straight into the packed cell grid."""
+    dx = abs(px2 - px1)
+    dy = abs(py2 - py1)
+    sx = 1 if px1 < px2 else -1
+    sy = 1 if py1 < py2 else -1
+    err = dx - dy
+
+    last_x = last_y = -1
+    first = True
+    px_curr, py_curr = px1, py1
+
+    while True:
+        p_x = px_curr >> ss_shift
+        p_y = py_curr >> ss_shift
+        # Supersampled steps collapse onto the same pixel in runs, only emit on change
+        if first or p_x != last_x or p_y != last_y:
+            first = False
+            last_x, last_y = p_x, p_y
+            cx = p_x >> x_shift
+            cy = p_y >> y_shift
+            if 0 <= cx < cols and 0 <= cy < rows:
+                idx = cy * cols + cx
+                # Keep the codepoint half, OR in the dot and replace the color half in a single store
+                grid[idx] = ((grid[idx] & 0xFFFF) | bit_lut[((p_x & x_mask) << 2) | (p_y & y_mask)]) | color_bits
+
+        if px_curr == px2 and py_curr == py2:
+            break
+
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            px_curr += sx
+        if e2 < dx:
+            err += dx
+            py_curr += sy
+
+
+compiled_scatter: Optional[Callable[..., Any]]
+try:
+    # Present only after an in-place build with cythonize -i
+    from unicodeplots.canvas._braille_c import bresenham_scatter as _compiled_scatter
+
+    compiled_scatter = _compiled_scatter
+except ImportError:
+    compiled_scatter = None
+
+_jit_scatter: Optional[Callable[..., Any]] = None
+_python_steps = 0
+
+
+def scatter_kernel(steps: int) -> Optional[Callable[..., Any]]:
+    """
+    Return a compiled segment kernel for a walk of `steps` supersampled steps, or None to walk it in Python.
+
+    The Cython kernel is used whenever it is built. The numba one is only compiled once the Python walks
+    have done about as much work as importing numba and loading its cache costs, then used from there on.
+    """
+    global _jit_scatter, _python_steps
+    if compiled_scatter is not None:
+        return compiled_scatter
+    if _jit_scatter is None and NUMBA_AVAILABLE:
+        _python_steps += steps
+        if _python_steps >= _JIT_BUDGET:
+            from numba import njit
+
+            # Compiled on first call and cached on disk
+            _jit_scatter = njit(cache=True, boundscheck=False)(_bresenham_scatter)
+    return _jit_scatter
@@ -1,11 +1,29 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from unicodeplots.canvas._bresenham import scatter_kernel
 from unicodeplots.canvas.canvas import Canvas
 from unicodeplots.utils import CanvasParams, Color, ColorType
+from unicodeplots.utils.backend import NUMPY_AVAILABLE, np
+
+# Braille dot bits flattened to one lookup indexed by (x_in << 2) | y_in, x=0 dots first then x=1
+_BIT_LUT = bytes([0x01, 0x02, 0x04, 0x40, 0x08, 0x10, 0x20, 0x80])
+_BIT_LUT_NP: Any = np.frombuffer(_BIT_LUT, dtype=np.uint8).astype(np.uint32) if NUMPY_AVAILABLE else None
+
+# Packed numpy grid layout: codepoint in the low 16 bits, color code (as int16) in the high 16 bits
+_CELL_MASK = 0xFFFF
+_COLOR_SHIFT = 16
+
+
+def _pack_color(code: int) -> int:
+    """Place a color code in the color half of a packed grid cell."""
+    return (code & 0xFFFF) << _COLOR_SHIFT
 
 
 class BrailleCanvas(Canvas):
     _SUPERSAMPLE: int = 8
+    _SUPERSAMPLE_SHIFT: int = 3  # log2(_SUPERSAMPLE)
+    _VECTORIZE_THRESHOLD: int = 32  # Segment count from which lines() batches plain sequences through vec_line
+    _SCATTER_THRESHOLD: int = 64  # Pixel count from which _draw_bresenham_segment scatters through numpy
 
     def __init__(self, params: Optional[CanvasParams] = None, **kwargs):
         """
@@ -18,44 +36,84 @@ class BrailleCanvas(Canvas):
         super().__init__(params=params, **kwargs)
         if self.plot_style.lower() == "line":
             self.default_char = 0x2800
-            self._x_pixels = 2
-            self._y_pixels = 4
-            self.grid_rows = self.grid_rows // self._y_pixels
-            self.grid_cols = self.grid_cols // self._x_pixels
+            self.x_pixel_per_char = 2
+            self.y_pixel_per_char = 4
+            self.grid_rows = self.grid_rows // self.y_pixel_per_char
+            self.grid_cols = self.grid_cols // self.x_pixel_per_char
+
+        # Cell dimensions are powers of two, so // and % reduce to shifts and masks
+        self._x_shift = self.x_pixel_per_char.bit_length() - 1
+        self._y_shift = self.y_pixel_per_char.bit_length() - 1
+        self._x_mask = self.x_pixel_per_char - 1
+        self._y_mask = self.y_pixel_per_char - 1
 
         self.default_color = Color.WHITE
-        self.active_cells = [[self.default_char] * self.grid_cols for _ in range(self.grid_rows)]
-        self.active_colors = [[self.default_color] * self.grid_cols for _ in range(self.grid_rows)]
 
-        # Precompute bit values for faster pixel calculations
-        self.bit_table = [
-            [0x01, 0x02, 0x04, 0x40],  # x=0
-            [0x08, 0x10, 0x20, 0x80],  # x=1
-        ]
+        # Flat row-major buffers, cell (cx, cy) lives at index cy * grid_cols + cx
+        num_cells = self.grid_rows * self.grid_cols
+        if NUMPY_AVAILABLE:
+            # Bits and color of a cell share one uint32, so a single scattered store updates both.
+            # Explicit little-endian keeps the codepoint in the first uint16 of each cell on every host.
+            self._grid = np.full(num_cells, self.default_char | _pack_color(self.default_color), dtype="<u4")
+            self._cells = self._grid.view("<u2")[0::2]
+            # int16 rather than uint8 so ColorType.INVALID (-1) survives the round trip
+            self._colors = self._grid.view("<i2")[1::2]
+            # Grown on demand by vec_line and reused across calls
+            self._scratch_px = np.empty(0, dtype=np.float64)
+        else:
+            self._cells = [self.default_char] * num_cells
+            self._colors = [int(self.default_color)] * num_cells
+
+        # Rendered rows are cached, drawing flags the rows it touches so render only redoes those.
+        # Nothing outside the drawing methods writes the buffers, which keeps the flags complete.
+        self._row_dirty: Any = np.ones(self.grid_rows, dtype=np.bool_) if NUMPY_AVAILABLE else [True] * self.grid_rows
+        self._row_cache: List[str] = [""] * self.grid_rows
 
     def _set_pixel(self, px: int, py: int, color: ColorType) -> None:
         """Set a pixel in the Braille grid representation."""
-        cx = px // self.x_pixel_per_char
-        cy = py // self.y_pixel_per_char
+        cols = self.grid_cols
+        cx = px >> self._x_shift
+        cy = py >> self._y_shift
 
-        if not (0 <= cx < self.grid_cols and 0 <= cy < self.grid_rows):
+        if not (0 <= cx < cols and 0 <= cy < self.grid_rows):
             return
 
-        try:
-            x_in = px % self.x_pixel_per_char
-            y_in = py % self.y_pixel_per_char
-            bit = self.bit_table[x_in][y_in]
-        except IndexError:
-            return
+        # Masks keep x_in in [0, 1] and y_in in [0, 3], so the lookup cannot go out of range
+        x_in = px & self._x_mask
+        y_in = py & self._y_mask
+        bit = _BIT_LUT[(x_in << 2) | y_in]
+
+        idx = cy * cols + cx
 
         # Update cell bits
-        self.active_cells[cy][cx] |= bit
+        self._cells[idx] |= bit
 
-        # Update color (simple overwrite)
-        self.active_colors[cy][cx] = color
+        # Update color (simple overwrite), only the integer code is stored
+        self._colors[idx] = int(color)
+        self._row_dirty[cy] = True
 
     def _draw_bresenham_segment(self, px1: int, py1: int, px2: int, py2: int, color: ColorType):
         """Draws a single line segment using Bresenham given INTEGER pixel coordinates."""
+        kernel = scatter_kernel(max(abs(px2 - px1), abs(py2 - py1)) + 1) if NUMPY_AVAILABLE else None
+        if kernel is not None:
+            kernel(
+                px1,
+                py1,
+                px2,
+                py2,
+                self._grid,
+                self.grid_cols,
+                self.grid_rows,
+                _pack_color(color),
+                _BIT_LUT_NP,
+                self._SUPERSAMPLE_SHIFT,
+                self._x_shift,
+                self._y_shift,
+                self._x_mask,
+                self._y_mask,
+            )
+            self._mark_rows_dirty(py1, py2)
+            return
 
         dx = abs(px2 - px1)
         dy = abs(py2 - py1)
@@ -63,11 +121,22 @@ class BrailleCanvas(Canvas):
         sy = 1 if py1 < py2 else -1
         err = dx - dy
 
-        pixels = set()
+        # Supersampled steps collapse onto the same pixel in runs, so only record a pixel when it changes
+        xs: List[int] = []
+        ys: List[int] = []
+        # Hoisted out of the loop, locals are much cheaper to read than attributes
+        add_x, add_y = xs.append, ys.append
+        ss_shift = self._SUPERSAMPLE_SHIFT
+        last_x = last_y = None
         px_curr, py_curr = px1, py1
 
         while True:
-            pixels.add((px_curr // self._SUPERSAMPLE, py_curr // self._SUPERSAMPLE))
+            p_x = px_curr >> ss_shift
+            p_y = py_curr >> ss_shift
+            if p_x != last_x or p_y != last_y:
+                add_x(p_x)
+                add_y(p_y)
+                last_x, last_y = p_x, p_y
 
             if px_curr == px2 and py_curr == py2:
                 break
@@ -80,12 +149,43 @@ class BrailleCanvas(Canvas):
                 err += dx
                 py_curr += sy
 
-        # Set the actual pixels on the canvas
-        for p_x, p_y in pixels:
-            self._set_pixel(p_x, p_y, color)
+        # Set the actual pixels on the canvas, the numpy scatter only pays off for long segments
+        if NUMPY_AVAILABLE and len(xs) >= self._SCATTER_THRESHOLD:
+            self._scatter_pixels(np.array(xs, dtype=np.int32), np.array(ys, dtype=np.int32), color)
+            return
+
+        # Inlined _set_pixel
+        code = int(color)
+        cells, colors, row_dirty = self._cells, self._colors, self._row_dirty
+        cols, rows = self.grid_cols, self.grid_rows
+        x_shift, y_shift, x_mask, y_mask = self._x_shift, self._y_shift, self._x_mask, self._y_mask
+        for p_x, p_y in zip(xs, ys):
+            cx = p_x >> x_shift
+            cy = p_y >> y_shift
+            if not (0 <= cx < cols and 0 <= cy < rows):
+                continue
+            idx = cy * cols + cx
+            cells[idx] |= _BIT_LUT[((p_x & x_mask) << 2) | (p_y & y_mask)]
+            colors[idx] = code
+            row_dirty[cy] = True
+
+    def _scatter_pixels(self, px, py, color: ColorType) -> None:
+        """Set arrays of pixels in one numpy scatter, the batched counterpart of _set_pixel."""
+        cx = px >> self._x_shift
+        cy = py >> self._y_shift
+        inside = (cx >= 0) & (cx < self.grid_cols) & (cy >= 0) & (cy < self.grid_rows)
+        px, py, cx, cy = px[inside], py[inside], cx[inside], cy[inside]
+
+        idx = cy * self.grid_cols + cx
+        bits = _BIT_LUT_NP.take(((px & self._x_mask) << 2) | (py & self._y_mask))
+        # Clear the color half of the touched cells, then OR dot bits and the new color in one scatter
+        self._grid[idx] &= _CELL_MASK
+        np.bitwise_or.at(self._grid, idx, bits | _pack_color(color))
+        self._row_dirty[cy] = True
 
     def line(self, x1: float, y1: float, x2: float, y2: float, color: ColorType):
         """Draw a line between logical coordinates using self._SUPERSAMPLEd Bresenham for smoother curves"""
+        color = ColorType.from_value(color)
 
         px1 = self.x_to_pixel(x1) * self._SUPERSAMPLE
         py1 = self.y_to_pixel(y1) * self._SUPERSAMPLE
@@ -98,9 +198,148 @@ class BrailleCanvas(Canvas):
 
         self._draw_bresenham_segment(px1, py1, px2, py2, color)
 
+    def _to_px_ss(self, values, origin: float, extent: float, pixels: int, complement: bool):
+        """
+        Map logical coordinates to rounded supersampled pixels in a reused scratch buffer.
+
+        Repeats the float operations of x_to_pixel/y_to_pixel in their order, so .5 ties round exactly as in line().
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if self._scratch_px.size < values.size:
+            self._scratch_px = np.empty(values.size, dtype=np.float64)
+        scratch = self._scratch_px[: values.size]
+        np.subtract(values, origin, out=scratch)
+        np.divide(scratch, extent, out=scratch)
+        if complement:
+            np.subtract(1, scratch, out=scratch)
+        np.multiply(scratch, pixels, out=scratch)
+        np.multiply(scratch, self._SUPERSAMPLE, out=scratch)
+        np.rint(scratch, out=scratch)
+        # min/max are NaN-propagating reductions, so this also rejects NaN and inf without a temporary.
+        # Bounding by 2**30 rather than the int32 range keeps endpoint differences in int32 as well.
+        if scratch.size and not (-(2**30) < scratch.min() and scratch.max() < 2**30):
+            raise ValueError("supersampled coordinates must be finite and within +-2**30")
+        return scratch.astype(np.int32)
+
+    def vec_line(self, x1: Sequence[float], y1: Sequence[float], x2: Sequence[float], y2: Sequence[float], color: ColorType):
+        """Rasterize a batch of segments at once with a closed-form Bresenham, requires numpy"""
+        color = ColorType.from_value(color)
+
+        x_map = (self.origin_x, self.width, self.pixel_width, self.xflip)
+        y_map = (self.origin_y, self.height, self.pixel_height, not self.yflip)
+        px1 = self._to_px_ss(x1, *x_map)
+        py1 = self._to_px_ss(y1, *y_map)
+        px2 = self._to_px_ss(x2, *x_map)
+        py2 = self._to_px_ss(y2, *y_map)
+        if px1.size == 0:
+            return
+
+        dx = np.abs(px2 - px1)
+        dy = np.abs(py2 - py1)
+        sx = np.where(px1 < px2, np.int32(1), np.int32(-1))
+        sy = np.where(py1 < py2, np.int32(1), np.int32(-1))
+
+        # Step i along the major axis moves the minor axis by ceil((2*i*d_minor - d_major) / (2*d_major)),
+        # which reproduces _draw_bresenham_segment pixel for pixel
+        major = np.maximum(dx, dy)
+        x_major = dx >= dy
+        first, last = self._visible_steps(px1, py1, sx, sy, dx, dy, major, x_major)
+
+        # Flatten the ragged per-segment walks: segment k contributes its visible steps first[k]..last[k]
+        steps = np.maximum(last - first + 1, 0)
+        seg = np.repeat(np.arange(px1.size, dtype=np.int32), steps)
+        # int32 holds 2 * i * d_minor below while segments stay under 2**15 supersampled steps
+        step_dtype = np.int32 if major.max() < 2**15 else np.int64
+        offsets = np.cumsum(steps, dtype=np.int64) - steps - first
+        i = (np.arange(seg.size, dtype=np.int64) - np.repeat(offsets, steps)).astype(step_dtype, copy=False)
+
+        x_major = x_major[seg]
+        d_major = major[seg].astype(step_dtype, copy=False)
+        d_minor = np.where(x_major, dy[seg], dx[seg]).astype(step_dtype, copy=False)
+        minor = -((d_major - 2 * i * d_minor) // np.maximum(2 * d_major, 1))
+
+        px = (px1[seg] + sx[seg] * np.where(x_major, i, minor)) >> self._SUPERSAMPLE_SHIFT
+        py = (py1[seg] + sy[seg] * np.where(x_major, minor, i)) >> self._SUPERSAMPLE_SHIFT
+        self._scatter_pixels(px, py, color)
+
+    def _visible_steps(self, px1, py1, sx, sy, dx, dy, major, x_major):
+        """
+        Clip each segment's walk to the steps that can land on the canvas.
+
+        Returns inclusive (first, last) step indices per segment as int64, first > last for segments
+        that miss the canvas entirely. The minor-axis bound is widened by a step on each side, the
+        exact bounds check is left to _scatter_pixels.
+        """
+        x_hi = (self.grid_cols << (self._x_shift + self._SUPERSAMPLE_SHIFT)) - 1
+        y_hi = (self.grid_rows << (self._y_shift + self._SUPERSAMPLE_SHIFT)) - 1
+        m1 = np.where(x_major, px1, py1).astype(np.int64)
+        n1 = np.where(x_major, py1, px1).astype(np.int64)
+        m_hi = np.where(x_major, x_hi, y_hi)
+        n_hi = np.where(x_major, y_hi, x_hi)
+        m_up = np.where(x_major, sx, sy) > 0
+        n_up = np.where(x_major, sy, sx) > 0
+        d_minor = np.where(x_major, dy, dx).astype(np.int64)
+
+        # The major coordinate moves by exactly one per step, so its bounds are exact
+        first = np.maximum(np.where(m_up, -m1, m1 - m_hi), 0)
+        last = np.minimum(np.where(m_up, m_hi - m1, m1), major)
+
+        # The minor offset stays within 1/2 of i * d_minor / d_major and never decreases
+        k_lo = np.clip(np.where(n_up, -n1, n1 - n_hi), -1, d_minor + 1)
+        k_hi = np.clip(np.where(n_up, n_hi - n1, n1), -1, d_minor + 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = major / d_minor
+            i_lo = np.floor((k_lo - 1) * ratio) - 1
+            i_hi = np.ceil((k_hi + 1) * ratio) + 1
+        # Without a minor delta the segment is visible throughout or not at all
+        flat = d_minor == 0
+        i_lo = np.where(flat, np.where(k_lo <= 0, 0, major + 1), i_lo).astype(np.int64)
+        i_hi = np.where(flat, np.where(k_hi >= 0, major, -1), i_hi).astype(np.int64)
+        return np.maximum(first, i_lo), np.minimum(last, i_hi)
+
+    def lines(self, x1: Sequence[float], y1: Sequence[float], x2: Sequence[float], y2: Sequence[float], color: ColorType):
+        """Draw segments (x1[i], y1[i]) -> (x2[i], y2[i]), vectorized for arrays and long sequences"""
+        if NUMPY_AVAILABLE and (type(x1) is np.ndarray or len(x1) >= self._VECTORIZE_THRESHOLD):
+            self.vec_line(x1, y1, x2, y2, color)
+        else:
+            super().lines(x1, y1, x2, y2, color)
+
+    def _mark_rows_dirty(self, py1: int, py2: int) -> None:
+        """Flag the cell rows spanned by supersampled y coordinates py1..py2 for re-rendering."""
+        shift = self._SUPERSAMPLE_SHIFT + self._y_shift
+        lo = max(min(py1, py2) >> shift, 0)
+        hi = min((max(py1, py2) >> shift) + 1, self.grid_rows)
+        if lo < hi:
+            self._row_dirty[lo:hi] = True
+
     def render(self) -> str:
-        """Efficient rendering with pre-allocated strings"""
-        return "\n".join(
-            "".join(ColorType(self.active_colors[row][col]).apply(chr(self.active_cells[row][col])) for col in range(self.grid_cols))
-            for row in range(self.grid_rows)
-        )
+        """Render the grid, re-formatting only rows touched since the last render"""
+        cols = self.grid_cols
+        if NUMPY_AVAILABLE:
+            dirty = np.flatnonzero(self._row_dirty).tolist()
+        else:
+            dirty = [row for row, flag in enumerate(self._row_dirty) if flag]
+
+        # Escape sequences per color code, built once per render instead of per cell
+        ansi: Dict[int, Tuple[str, str]] = {}
+        for row in dirty:
+            start = row * cols
+            row_colors = self._colors[start : start + cols]
+            if NUMPY_AVAILABLE:
+                chars = (self._grid[start : start + cols] & _CELL_MASK).astype("<u4", copy=False).tobytes().decode("utf-32-le")
+                bounds = [0, *(np.flatnonzero(np.diff(row_colors)) + 1).tolist(), cols]
+                row_colors = row_colors.tolist()
+            else:
+                chars = "".join(map(chr, self._cells[start : start + cols]))
+                bounds = [0, *(col for col in range(1, cols) if row_colors[col] != row_colors[col - 1]), cols]
+            parts: List[str] = []
+            for a, b in zip(bounds, bounds[1:]):
+                code = row_colors[a]
+                if code not in ansi:
+                    color = ColorType.from_value(code)
+                    ansi[code] = (color.ansi_prefix(), color.ansi_suffix())
+                prefix, suffix = ansi[code]
+                parts += (prefix, chars[a:b], suffix)
+            self._row_cache[row] = "".join(parts)
+            self._row_dirty[row] = False
+        return "\n".join(self._row_cache)
@@ -1,13 +1,14 @@
 import math
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List
+from typing import Any, Callable, Sequence
 
 from unicodeplots.utils import CanvasParams, ColorType
 
 
 class Canvas(ABC):
-    _x_pixels = 1
-    _y_pixels = 1
+    # Plain attributes rather than properties, they are read on every pixel
+    x_pixel_per_char: int = 1
+    y_pixel_per_char: int = 1
 
     def __init__(self, **kwargs):
         self._params = CanvasParams(**kwargs)
@@ -23,8 +24,10 @@ class Canvas(ABC):
         self.grid_rows = self.pixel_height // self.y_pixel_per_char
         self.grid_cols = self.pixel_width // self.x_pixel_per_char
 
-        self.active_cells: List[List[Any]] = [[] for _ in range(self.grid_rows)]
-        self.active_colors: List[List[ColorType]] = [[] for _ in range(self.grid_rows)]
+        # Flat row-major cell buffers, subclasses allocate grid_rows * grid_cols entries.
+        # Private because subclasses may cache rendered output, all writes go through the drawing methods.
+        self._cells: Any = []
+        self._colors: Any = []
 
     def _align_to_char_length(self, length: int) -> int:
         """Ensure length is aligned to character cell boundaries"""
@@ -33,14 +36,6 @@ class Canvas(ABC):
             return length + (self.x_pixel_per_char - remainder)
         return length
 
-    @property
-    def x_pixel_per_char(self) -> int:
-        return self._x_pixels
-
-    @property
-    def y_pixel_per_char(self) -> int:
-        return self._y_pixels
-
     @abstractmethod
     def _set_pixel(self, px: int, py: int, color: ColorType):
         """Set a pixel in the Braille grid representation."""
@@ -49,6 +44,11 @@ class Canvas(ABC):
     def line(self, x1: float, y1: float, x2: float, y2: float, color: ColorType):
         """Draw a line between logical coordinates (x1,y1) and (x2,y2)"""
 
+    def lines(self, x1: Sequence[float], y1: Sequence[float], x2: Sequence[float], y2: Sequence[float], color: ColorType):
+        """Draw a batch of segments (x1[i], y1[i]) -> (x2[i], y2[i]) in a single color"""
+        for sx1, sy1, sx2, sy2 in zip(x1, y1, x2, y2):
+            self.line(sx1, sy1, sx2, sy2, color)
+
     @abstractmethod
     def render(self) -> str:
         """Rendering of canvas to string"""
@@ -89,14 +89,14 @@ class Canvas(ABC):
     def rows(self) -> int:
         """Returns the number of active rows in the canvas."""
         if self.cols:
-            return len(self.active_cells[0])
+            return self.grid_cols
         else:
             return 0
 
     @property
     def cols(self) -> int:
         """Returns the number of active columns in the canvas."""
-        return len(self.active_cells)
+        return self.grid_rows
 
     @property
     def resolution(self) -> float:
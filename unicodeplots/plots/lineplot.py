@@ -1,8 +1,11 @@
-from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 from unicodeplots.canvas import BrailleCanvas
 from unicodeplots.components import BorderBox
 from unicodeplots.utils import Color, ColorType
+from unicodeplots.utils.backend import NUMPY_AVAILABLE, np
+
+_NUMBER_TYPES = (int, float)
 
 
 class Lineplot:
@@ -56,12 +59,19 @@ class Lineplot:
 
     def _validate_data(self, data: Iterable, name: str) -> List[Union[float, int]]:
         """Validate that data is an iterable of numbers."""
+        # A 1-D numeric array is validated by its dtype once instead of per element
+        if NUMPY_AVAILABLE and type(data) is np.ndarray:
+            array: Any = data
+            if array.ndim == 1 and array.dtype.kind in "biuf":
+                return array.tolist()
+
         if not isinstance(data, Iterable) or isinstance(data, str):
             raise TypeError(f"{name} data must be an iterable (list, tuple, etc.) of numbers, got {type(data)}")
 
         validated: List[Union[float, int]] = []
         for value in data:
-            if not isinstance(value, (int, float)):
+            # Exact type check first, isinstance only for subclasses
+            if type(value) not in _NUMBER_TYPES and not isinstance(value, _NUMBER_TYPES):
                 raise TypeError(f"{name} values must be numbers (int or float), got {type(value)}")
             validated.append(value)
         return validated
@@ -81,7 +91,11 @@ class Lineplot:
         actual_y_raw: Iterable[Union[int, float]]
         if callable(y_raw):
             try:
-                actual_y_raw = [y_raw(x) for x in validated_x]
+                if NUMPY_AVAILABLE and isinstance(y_raw, np.ufunc):
+                    # Ufuncs are elementwise, evaluate them over the whole array in one call
+                    actual_y_raw = y_raw(np.asarray(validated_x, dtype=np.float64)).tolist()
+                else:
+                    actual_y_raw = [y_raw(x) for x in validated_x]
             except Exception as e:
                 raise ValueError(f"Error applying function to X data for dataset {dataset_index + 1}: {e}") from e
             # Validate the results from the callable
@@ -109,6 +123,7 @@ class Lineplot:
         - y_data only: [1, 2, 3] (x will be range(len(y)))
         - x_data, y_data: [1, 2, 3], [4, 5, 6]
         - x_data, callable: [1, 2, 3], lambda x: x**2
+          (numpy ufuncs such as np.sin are applied to all x at once, other callables per element)
         - Multiple pairs: x1, y1, x2, y2, ... (y can be data or callable)
 
         Returns:
@@ -207,9 +222,8 @@ class Lineplot:
         for idx, (x_data, y_data) in enumerate(self.datasets):
             color = self.colors[idx % len(self.colors)]
 
-            for i in range(1, len(x_data)):
-                # Draw the line segment - canvas will handle the scaling
-                self.canvas.line(x_data[i - 1], y_data[i - 1], x_data[i], y_data[i], color=color)
+            # Draw all segments at once - canvas will handle the scaling
+            self.canvas.lines(x_data[:-1], y_data[:-1], x_data[1:], y_data[1:], color=color)
         return self
 
     def render(self) -> str:
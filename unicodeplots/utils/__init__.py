@@ -1,6 +1,7 @@
+from unicodeplots.utils.backend import NUMPY_AVAILABLE
 from unicodeplots.utils.colors import INVALID_COLOR, ColorType
 from unicodeplots.utils.params import BoxParams, CanvasParams
 
 Color = ColorType
 
-__all__ = ["Color", "ColorType", "INVALID_COLOR", "CanvasParams", "BoxParams"]
+__all__ = ["Color", "ColorType", "INVALID_COLOR", "CanvasParams", "BoxParams", "NUMPY_AVAILABLE"]
@@ -0,0 +1,14 @@
+from importlib.util import find_spec
+from typing import Any
+
+np: Any
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# numba takes a few hundred ms to import, so only probe for it here and import it where it is used
+NUMBA_AVAILABLE = find_spec("numba") is not None
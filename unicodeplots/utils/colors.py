@@ -1,4 +1,5 @@
 from enum import IntEnum
+from typing import Any, Dict
 
 INVALID_COLOR = -1
 
@@ -21,17 +22,34 @@ class ColorType(IntEnum):
         """Allow creation from any integer while preserving enum benefits"""
         return cls.INVALID
 
+    @classmethod
+    def from_value(cls, value: Any) -> "ColorType":
+        """Memoized equivalent of ColorType(value), a dict lookup instead of the enum constructor"""
+        try:
+            return _COLOR_CACHE[value]
+        except (KeyError, TypeError):
+            return cls(value)
+
     def ansi_prefix(self) -> str:
         """Generate ANSI escape code for the color"""
         if self == ColorType.INVALID:
             return ""
         return f"\033[38;5;{self.value}m"
 
+    def ansi_suffix(self) -> str:
+        """Generate ANSI reset code closing the color"""
+        if self == ColorType.INVALID:
+            return ""
+        return "\033[0m"
+
     def apply(self, text: str) -> str:
         """Apply color to text with reset at end"""
         if self == ColorType.INVALID:
             return text
-        return f"{self.ansi_prefix()}{text}\033[0m"
+        return f"{self.ansi_prefix()}{text}{self.ansi_suffix()}"
+
+
+_COLOR_CACHE: Dict[Any, ColorType] = {color.value: color for color in ColorType}
 
 
 Color = ColorType